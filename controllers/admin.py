@@ -4,10 +4,12 @@ from config import ADMIN_MENU
 from services.fingerprint import *
 from services.time_tracker import *
 from database.db_operations import *
-from utils.display_helpers import display_menu, get_user_input, confirm_action, display_separator, get_num
+from utils.display_helpers import display_menu, get_user_input, confirm_action, display_separator, display_empty_state, get_num
 
 import time
 
+NO_STUDENTS_MESSAGE = "No students enrolled in the system."
+
 def admin_enroll():
     """Enroll new student with fingerprint authentication"""
     if finger.read_templates() != adafruit_fingerprint.OK:
@@ -19,11 +21,12 @@ def admin_enroll():
     success = enroll_finger_with_student_info(location)
     print(f"Student enrollment {'✅ completed successfully!' if success else '❌ failed.'}")
 
-def admin_view_enrolled():
+def admin_view_enrolled(database=None):
     """Display all enrolled students with their information"""
-    database = load_fingerprint_database()
+    if database is None:
+        database = load_fingerprint_database()
     if not database:
-        print("📁 No students enrolled in the system.")
+        display_empty_state(NO_STUDENTS_MESSAGE)
         return
     
     print("\n👥 ENROLLED STUDENTS:")
@@ -37,20 +40,19 @@ def admin_view_enrolled():
             f"📚 Course: {info.get('course', 'N/A')}",
             f"🪪 License: {info.get('license_number', 'N/A')}",
             f"📅 License Exp: {info.get('license_expiration', 'N/A')}",
-            f"🕒 Enrolled: {info.get('enrolled_date', 'Unknown')}"
+            f"🕒 Enrolled: {info.get('enrolled_date', 'Unknown')}",
+            "-" * 50
         ]
-        for line in student_data:
-            print(line)
-        print("-" * 50)
+        print("\n".join(student_data))
 
 def admin_delete_fingerprint():
     """Delete student fingerprint from system"""
     database = load_fingerprint_database()
     if not database:
-        print("📁 No students enrolled in the system.")
+        display_empty_state(NO_STUDENTS_MESSAGE)
         return
     
-    admin_view_enrolled()
+    admin_view_enrolled(database)
     
     try:
         finger_id = get_user_input("Enter Fingerprint Slot ID to delete")
@@ -144,7 +146,7 @@ def admin_view_time_records():
     """View all student time in/out records"""
     records = get_all_time_records()
     if not records:
-        print("📁 No time records found.")
+        display_empty_state("No time records found.")
         return
     
     print("\n🕒 TIME IN/OUT RECORDS:")
@@ -152,11 +154,12 @@ def admin_view_time_records():
     
     for record in records:
         status_icon = "🟢" if record['status'] == 'IN' else "🔴"
-        print(f"{status_icon} {record['student_name']} ({record['student_id']})")
-        print(f"   📅 Date: {record['date']}")
-        print(f"   🕒 Time: {record['time']}")
-        print(f"   📊 Status: {record['status']}")
-        print("-" * 50)
+        # One write per record rather than one per line
+        print(f"{status_icon} {record['student_name']} ({record['student_id']})\n"
+              f"   📅 Date: {record['date']}\n"
+              f"   🕒 Time: {record['time']}\n"
+              f"   📊 Status: {record['status']}\n"
+              f"{'-' * 50}")
 
 def admin_clear_time_records():
     """Clear all time records with confirmation"""
@@ -169,24 +172,26 @@ def admin_clear_time_records():
     else:
         print("❌ Failed to clear time records.")
 
+# Menu choice -> handler, built once at import instead of on every loop
+ADMIN_ACTIONS = {
+    "1": admin_enroll,
+    "2": admin_view_enrolled,
+    "3": admin_delete_fingerprint,
+    "4": admin_reset_all,
+    "5": admin_sync_database,
+    "6": admin_view_time_records,
+    "7": admin_clear_time_records
+}
+
 def admin_panel():
     """Main admin panel controller"""
     while True:
         display_menu(ADMIN_MENU)
         choice = get_user_input("Select admin option")
         
-        actions = {
-            "1": admin_enroll,
-            "2": admin_view_enrolled,
-            "3": admin_delete_fingerprint,
-            "4": admin_reset_all,
-            "5": admin_sync_database,
-            "6": admin_view_time_records,
-            "7": admin_clear_time_records
-        }
-        
-        if choice in actions:
-            actions[choice]()
+        action = ADMIN_ACTIONS.get(choice)
+        if action:
+            action()
         elif choice == "8":
             break
         else:
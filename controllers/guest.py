@@ -4,14 +4,25 @@ from services.license_reader import *
 from services.helmet_infer import verify_helmet
 from services.time_tracker import *
 from utils.display_helpers import display_separator, display_verification_result
-from utils.gui_helpers import show_results_gui, get_guest_info_gui, updated_guest_office_gui
-import tkinter as tk
-from tkinter import simpledialog, messagebox
-import difflib
+import sqlite3
 import time
+from difflib import SequenceMatcher
+
+# OCR lines containing any of these are address/header text, not a name
+NAME_FILTER_KEYWORDS = (
+    'ROAD', 'STREET', 'AVENUE', 'BOULEVARD', 'DISTRICT', 'CITY', 'PROVINCE',
+    'BARANGAY', 'SUBDIVISION', 'VILLAGE', 'TOWN', 'MUNICIPALITY', 'REGION',
+    'REPUBLIC', 'PHILIPPINES', 'DEPARTMENT', 'TRANSPORTATION', 
+    'LAND TRANSPORTATION OFFICE', 'DRIVER', 'LICENSE', 'NON-PROFESSIONAL',
+    'PROFESSIONAL', 'LAST NAME', 'FIRST NAME', 'MIDDLE NAME', 'NATIONALITY',
+    'DATE', 'BIRTH', 'ADDRESS', 'WEIGHT', 'HEIGHT', 'EYES', 'HAIR', 'SEX'
+)
 
 def guest_verification():
     """Main guest verification workflow - FIXED VERSION"""
+    # Tk forms are only needed once a guest reaches this flow
+    from utils.gui_helpers import get_guest_info_gui, updated_guest_office_gui
+    
     print("\n👤 GUEST VERIFICATION SYSTEM")
     
     # Step 1: Helmet verification (always required)
@@ -112,7 +123,7 @@ Status: {time_result['status']}
             'is_guest': True
         }
         
-        license_result = licenseReadGuest(image_path, guest_data_for_license)
+        license_result = licenseReadGuest(image_path, guest_data_for_license, basic_text=ocr_preview)
         time_result = process_guest_time_in(existing_guest_info, license_result)
         print(f"\n🕒 {time_result['message']}")
         
@@ -169,7 +180,7 @@ Status: {time_result['status']}
             'is_guest': True
         }
         
-        license_result = licenseReadGuest(image_path, guest_data_for_license)
+        license_result = licenseReadGuest(image_path, guest_data_for_license, basic_text=ocr_preview)
         
         # Process time in
         time_result = process_guest_time_in(guest_info_input, license_result)
@@ -212,15 +223,6 @@ Status: {time_result['status']}
 
 def extract_guest_name_from_license(ocr_lines):
     """Extract guest name from license OCR with improved accuracy"""
-    filter_keywords = [
-        'ROAD', 'STREET', 'AVENUE', 'BOULEVARD', 'DISTRICT', 'CITY', 'PROVINCE',
-        'BARANGAY', 'SUBDIVISION', 'VILLAGE', 'TOWN', 'MUNICIPALITY', 'REGION',
-        'REPUBLIC', 'PHILIPPINES', 'DEPARTMENT', 'TRANSPORTATION', 
-        'LAND TRANSPORTATION OFFICE', 'DRIVER', 'LICENSE', 'NON-PROFESSIONAL',
-        'PROFESSIONAL', 'LAST NAME', 'FIRST NAME', 'MIDDLE NAME', 'NATIONALITY',
-        'DATE', 'BIRTH', 'ADDRESS', 'WEIGHT', 'HEIGHT', 'EYES', 'HAIR', 'SEX'
-    ]
-    
     potential_names = []
     
     for line in ocr_lines:
@@ -228,7 +230,7 @@ def extract_guest_name_from_license(ocr_lines):
         
         # Skip invalid lines
         if (not line_clean or len(line_clean) < 5 or len(line_clean) > 50 or
-            any(keyword in line_clean for keyword in filter_keywords) or
+            any(keyword in line_clean for keyword in NAME_FILTER_KEYWORDS) or
             any(char.isdigit() for char in line_clean)):
             continue
         
@@ -252,9 +254,6 @@ def extract_guest_name_from_license(ocr_lines):
 def find_timed_in_guest(detected_name):
     """Find a currently timed-in guest by name matching - SIMPLIFIED"""
     try:
-        import sqlite3
-        from difflib import SequenceMatcher
-        
         conn = sqlite3.connect("database/time_tracking.db")
         cursor = conn.cursor()
         
@@ -289,8 +288,6 @@ def find_timed_in_guest(detected_name):
                 guest_name.upper() in detected_name.upper()):
                 similarity = max(similarity, 0.8)
             
-            print(f"   📋 Comparing: '{detected_name}' vs '{guest_name}' = {similarity:.2f}")
-            
             if similarity > highest_similarity and similarity > 0.6:  # 60% threshold
                 highest_similarity = similarity
                 best_match = guest_record
@@ -311,7 +308,7 @@ def find_timed_in_guest(detected_name):
         
         return None
         
-    except Exception as e:
+    except sqlite3.Error as e:
         print(f"❌ Error finding timed-in guest: {e}")
         return None
         
@@ -321,9 +318,6 @@ def get_guest_time_status(detected_name, plate_number=None):
     Returns: ('IN', guest_info) if currently timed in, ('OUT', guest_info) if found but timed out, (None, None) if not found
     """
     try:
-        import sqlite3
-        from difflib import SequenceMatcher
-        
         conn = sqlite3.connect("database/time_tracking.db")
         cursor = conn.cursor()
         
@@ -367,8 +361,6 @@ def get_guest_time_status(detected_name, plate_number=None):
                 if plate_number.upper() == guest_plate.upper():
                     similarity = max(similarity, 0.9)
             
-            print(f"   📋 Comparing: '{detected_name}' vs '{guest_name}' = {similarity:.2f}")
-            
             if similarity > highest_similarity and similarity > 0.6:  # 60% threshold
                 highest_similarity = similarity
                 best_match = record
@@ -389,7 +381,7 @@ def get_guest_time_status(detected_name, plate_number=None):
         
         return None, None
         
-    except Exception as e:
+    except sqlite3.Error as e:
         print(f"❌ Error checking guest status: {e}")
         return None, None
 
@@ -7,7 +7,6 @@ from services.time_tracker import *
 from services.led_control import set_led_processing, set_led_success, set_led_idle
 
 from utils.display_helpers import display_separator, display_verification_result
-from utils.gui_helpers import show_results_gui
 
 import time
 
@@ -61,7 +60,7 @@ def student_verification():
         ocr_preview = extract_text_from_image(image_path)
         ocr_lines = [line.strip() for line in ocr_preview.splitlines() if line.strip()]
         name_from_ocr, sim_score = find_best_line_match(student_info['name'], ocr_lines)
-        result = licenseRead(image_path, student_info)
+        result = licenseRead(image_path, student_info, basic_text=ocr_preview)
         
         # Prepare verification data
         verification_checks = {
@@ -1,8 +1,9 @@
+import os
+import sqlite3
+
 def init_guest_database():
     """Initialize clean guest database structure"""
     try:
-        import sqlite3
-        
         # Only use time_tracking.db for all guest operations
         conn = sqlite3.connect("time_tracking.db")
         cursor = conn.cursor()
@@ -46,9 +47,6 @@ def init_guest_database():
 def cleanup_guest_data():
     """Clean up any orphaned guest data"""
     try:
-        import sqlite3
-        import os
-        
         # Remove old guest_info.db if it exists
         if os.path.exists("database/guest_info.db"):
             os.remove("database/guest_info.db")
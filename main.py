@@ -12,6 +12,7 @@ from services.led_control import init_led_system, set_led_idle, cleanup_led_syst
 from services.rpi_camera import get_camera, release_camera
 from time_tracker import *
 import atexit
+import sqlite3
 
 # =================== MAIN SYSTEM FUNCTIONS ===================
 
@@ -35,10 +36,9 @@ def initialize_system():
         if finger_ok:
             # Get actual enrolled count from fingerprint database
             try:
-                from services.fingerprint import load_fingerprint_database
                 fingerprint_db = load_fingerprint_database()
                 finger_count = len(fingerprint_db)
-            except:
+            except Exception:
                 # Fallback to sensor template count
                 if finger.read_templates() == adafruit_fingerprint.OK:
                     finger_count = finger.template_count if finger.template_count is not None else 0
@@ -49,20 +49,19 @@ def initialize_system():
         # Test student database
         student_count = 0
         try:
-            import sqlite3
             conn = sqlite3.connect("database/students.db")
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM students")
             student_count = cursor.fetchone()[0]
             conn.close()
             student_db_ok = True
-        except:
+        except sqlite3.Error:
             student_db_ok = False
         
         # Test helmet detection model
         try:
             helmet_model_ok = session is not None
-        except:
+        except NameError:
             helmet_model_ok = False
         
         # Display results
@@ -93,6 +92,13 @@ def initialize_system():
         print(f"❌ System initialization failed: {e}")
         return False
 
+# Menu choice -> (announcement, handler), built once at import
+MAIN_ACTIONS = {
+    "1": ("🔍 Admin Panel", admin_panel),
+    "2": ("🎓 Student Verification", student_verification),
+    "3": ("👤 Guest Verification", guest_verification)
+}
+
 def main_system():
     """Main system controller"""
     print(f"🚗 Welcome to {SYSTEM_NAME}!")
@@ -101,14 +107,8 @@ def main_system():
         display_menu(MAIN_MENU)
         choice = get_user_input("Select user type")
         
-        actions = {
-            "1": ("🔍 Admin Panel", admin_panel),
-            "2": ("🎓 Student Verification", student_verification),
-            "3": ("👤 Guest Verification", guest_verification)
-        }
-        
-        if choice in actions:
-            message, action = actions[choice]
+        if choice in MAIN_ACTIONS:
+            message, action = MAIN_ACTIONS[choice]
             print(f"{message}...")
             action()
             set_led_idle()
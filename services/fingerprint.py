@@ -6,13 +6,62 @@ import adafruit_fingerprint
 import json
 import os
 import sqlite3
-import tkinter as tk
-from tkinter import simpledialog, messagebox
 
 # =================== FINGERPRINT SETUP ===================
 uart = serial.Serial("/dev/ttyS0", baudrate=57600, timeout=1)
 finger = adafruit_fingerprint.Adafruit_Fingerprint(uart)
 
+# Idle pause between sensor image polls; short so a placed finger is picked
+# up quickly, non-zero so waiting doesn't peg the CPU
+FINGER_POLL_INTERVAL = 0.01  # seconds
+# Enrollment prints one progress dot per this many empty polls; each poll also
+# includes the GetImage UART round-trip, so the dot rate varies with the sensor
+POLLS_PER_DOT = 10
+
+# Sensor status codes -> messages for each enrollment step; anything else is "Other error"
+IMAGE_TO_TEMPLATE_ERRORS = {
+    adafruit_fingerprint.IMAGEMESS: "Image too messy",
+    adafruit_fingerprint.FEATUREFAIL: "Could not identify features",
+    adafruit_fingerprint.INVALIDIMAGE: "Image invalid",
+}
+CREATE_MODEL_ERRORS = {
+    adafruit_fingerprint.ENROLLMISMATCH: "Prints did not match",
+}
+STORE_MODEL_ERRORS = {
+    adafruit_fingerprint.BADLOCATION: "Bad storage location",
+    adafruit_fingerprint.FLASHERR: "Flash storage error",
+}
+
+# Consecutive UART read failures tolerated before treating the sensor as down
+MAX_SENSOR_ERRORS = 3
+# Base of the exponential back-off after a failed read (0.2, 0.4, 0.8 s), kept
+# apart from FINGER_POLL_INTERVAL so a brief glitch doesn't fail authentication
+SENSOR_ERROR_BACKOFF = 0.1  # seconds
+
+def wait_for_finger():
+    """Block until the sensor captures a finger image; False if the sensor keeps failing"""
+    error_streak = 0
+    while True:
+        try:
+            if finger.get_image() == adafruit_fingerprint.OK:
+                return True
+            error_streak = 0
+        except (OSError, RuntimeError):
+            # adafruit_fingerprint raises RuntimeError on garbled/missing packets
+            error_streak += 1
+            if error_streak > MAX_SENSOR_ERRORS:
+                print("❌ Fingerprint sensor not responding")
+                return False
+        if error_streak:
+            time.sleep(SENSOR_ERROR_BACKOFF * (2 ** error_streak))
+        else:
+            time.sleep(FINGER_POLL_INTERVAL)
+
+def wait_for_finger_removal():
+    """Block until the finger has been lifted off the sensor"""
+    while finger.get_image() != adafruit_fingerprint.NOFINGER:
+        time.sleep(FINGER_POLL_INTERVAL)
+
 # =================== DATA STORAGE ===================
 FINGERPRINT_DATA_FILE = "json_folder/fingerprint_database.json"
 STUDENT_DB_FILE = "database/students.db"
@@ -24,7 +73,7 @@ def load_fingerprint_database():
         try:
             with open(FINGERPRINT_DATA_FILE, 'r') as f:
                 return json.load(f)
-        except:
+        except (OSError, ValueError):  # ValueError covers JSONDecodeError and bad UTF-8
             return {}
     return {}
 
@@ -258,6 +307,9 @@ def get_students_currently_in():
 
 def get_student_id_gui():
     """Get student ID via GUI and fetch student information"""
+    import tkinter as tk
+    from tkinter import simpledialog, messagebox
+    
     root = tk.Tk()
     root.withdraw()
     
@@ -302,13 +354,6 @@ Proceed with fingerprint enrollment for this student?
                 root.destroy()
                 return None
 
-def show_message_gui(title, message):
-    """Show message dialog"""
-    root = tk.Tk()
-    root.withdraw()
-    messagebox.showinfo(title, message)
-    root.destroy()
-
 def display_student_info(student_info):
     """Display student information in console"""
     print("\n" + "="*50)
@@ -342,13 +387,17 @@ def enroll_finger_with_student_info(location):
         else:
             print("👆 Place same finger again...", end="")
 
+        empty_polls = 0
         while True:
             i = finger.get_image()
             if i == adafruit_fingerprint.OK:
                 print("✅")
                 break
             if i == adafruit_fingerprint.NOFINGER:
-                print(".", end="")
+                empty_polls += 1
+                if empty_polls % POLLS_PER_DOT == 0:
+                    print(".", end="", flush=True)
+                time.sleep(FINGER_POLL_INTERVAL)
             elif i == adafruit_fingerprint.IMAGEFAIL:
                 print("❌ Imaging error")
                 return False
@@ -361,31 +410,20 @@ def enroll_finger_with_student_info(location):
         if i == adafruit_fingerprint.OK:
             print("✅")
         else:
-            if i == adafruit_fingerprint.IMAGEMESS:
-                print("❌ Image too messy")
-            elif i == adafruit_fingerprint.FEATUREFAIL:
-                print("❌ Could not identify features")
-            elif i == adafruit_fingerprint.INVALIDIMAGE:
-                print("❌ Image invalid")
-            else:
-                print("❌ Other error")
+            print(f"❌ {IMAGE_TO_TEMPLATE_ERRORS.get(i, 'Other error')}")
             return False
 
         if fingerimg == 1:
             print("✋ Remove finger")
             time.sleep(1)
-            while i != adafruit_fingerprint.NOFINGER:
-                i = finger.get_image()
+            wait_for_finger_removal()
 
     print("🗝️ Creating model...", end="")
     i = finger.create_model()
     if i == adafruit_fingerprint.OK:
         print("✅")
     else:
-        if i == adafruit_fingerprint.ENROLLMISMATCH:
-            print("❌ Prints did not match")
-        else:
-            print("❌ Other error")
+        print(f"❌ {CREATE_MODEL_ERRORS.get(i, 'Other error')}")
         return False
 
     print(f"💾 Storing model #{location}...", end="")
@@ -419,23 +457,19 @@ Enrollment Successful! ✅
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         """
         
+        from utils.gui_helpers import show_message_gui
         show_message_gui("Enrollment Complete", success_message)
         return True
     else:
-        if i == adafruit_fingerprint.BADLOCATION:
-            print("❌ Bad storage location")
-        elif i == adafruit_fingerprint.FLASHERR:
-            print("❌ Flash storage error")
-        else:
-            print("❌ Other error")
+        print(f"❌ {STORE_MODEL_ERRORS.get(i, 'Other error')}")
         return False
 
 def authenticate_fingerprint():
     """Authenticate fingerprint and return complete student information"""
     print("\n🔒 Please place your finger on the sensor for authentication...")
     
-    while finger.get_image() != adafruit_fingerprint.OK:
-        pass
+    if not wait_for_finger():
+        return None
     
     print("🔄 Processing fingerprint...")
     if finger.image_2_tz(1) != adafruit_fingerprint.OK:
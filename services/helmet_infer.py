@@ -4,6 +4,7 @@ import cv2
 import numpy as np
 import onnxruntime as ort
 import time
+from functools import lru_cache
 from services.rpi_camera import get_camera
 
 # === Helmet Detection Config ===
@@ -13,6 +14,11 @@ INPUT_SIZE = 320
 HELMET_DETECTION_DURATION = 2  # seconds to detect helmet
 CLASS_NAMES = ["Nutshell", "full-face helmet"]
 
+# === Overlay layout (fixed per run, so kept out of the frame loop) ===
+PROGRESS_BAR_WIDTH = 400
+PROGRESS_BAR_HEIGHT = 30
+PROGRESS_BAR_Y = 50
+
 # === Load ONNX model ===
 try:
     session = ort.InferenceSession(MODEL_PATH, providers=["CPUExecutionProvider"])
@@ -23,6 +29,11 @@ except Exception as e:
     session = None
     input_name = None
 
+@lru_cache(maxsize=8)
+def text_width(text, font_scale, thickness):
+    """Pixel width of a fixed overlay label; only use for constant strings"""
+    return cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0][0]
+
 def preprocess_helmet(frame):
     """Preprocess frame for helmet detection"""
     img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
@@ -89,6 +100,7 @@ def verify_helmet():
         return False
     
     detection_start = None
+    last_reported_second = None
     consecutive_detections = 0
     required_consecutive = 5  # Require 5 consecutive detections for stability
     
@@ -164,30 +176,32 @@ def verify_helmet():
                     elapsed = current_time - detection_start
                     
                     # Show countdown on frame
-                    progress_bar_width = 400
-                    progress_bar_height = 30
-                    progress_x = (frame.shape[1] - progress_bar_width) // 2
-                    progress_y = 50
+                    progress_x = (frame.shape[1] - PROGRESS_BAR_WIDTH) // 2
+                    progress_y = PROGRESS_BAR_Y
                     
                     # Draw progress bar background
                     cv2.rectangle(frame, (progress_x, progress_y), 
-                                 (progress_x + progress_bar_width, progress_y + progress_bar_height), 
+                                 (progress_x + PROGRESS_BAR_WIDTH, progress_y + PROGRESS_BAR_HEIGHT), 
                                  (50, 50, 50), -1)
                     
                     # Draw progress
-                    progress_width = int((elapsed / HELMET_DETECTION_DURATION) * progress_bar_width)
+                    progress_width = int((elapsed / HELMET_DETECTION_DURATION) * PROGRESS_BAR_WIDTH)
                     cv2.rectangle(frame, (progress_x, progress_y), 
-                                 (progress_x + progress_width, progress_y + progress_bar_height), 
+                                 (progress_x + progress_width, progress_y + PROGRESS_BAR_HEIGHT), 
                                  (0, 255, 0), -1)
                     
                     # Progress text
                     progress_text = f"Helmet Verified: {elapsed:.1f}/{HELMET_DETECTION_DURATION}s"
-                    text_size = cv2.getTextSize(progress_text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
-                    text_x = (frame.shape[1] - text_size[0]) // 2
+                    # Changes every frame, so measure directly rather than through the label cache
+                    progress_size = cv2.getTextSize(progress_text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
+                    text_x = (frame.shape[1] - progress_size[0]) // 2
                     cv2.putText(frame, progress_text, (text_x, progress_y + 95),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
                     
-                    print(f"⏱️ Helmet verified for {elapsed:.1f}/{HELMET_DETECTION_DURATION} seconds")
+                    # Console only needs whole-second progress, not one line per frame
+                    if int(elapsed) != last_reported_second:
+                        last_reported_second = int(elapsed)
+                        print(f"⏱️ Helmet verified for {last_reported_second}/{HELMET_DETECTION_DURATION} seconds")
                     
                     if elapsed >= HELMET_DETECTION_DURATION:
                         print("✅ Helmet verification successful!")
@@ -212,6 +226,7 @@ def verify_helmet():
                 if detection_start is not None:
                     print("⚠️ Full-face helmet lost! Please keep helmet visible...")
                 detection_start = None
+                last_reported_second = None
                 
                 # Show status on frame
                 if nutshell_detected:
@@ -221,8 +236,7 @@ def verify_helmet():
                     status_text = "Please wear FULL-FACE HELMET"
                     status_color = (0, 165, 255)  # Orange
                 
-                text_size = cv2.getTextSize(status_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
-                text_x = (frame.shape[1] - text_size[0]) // 2
+                text_x = (frame.shape[1] - text_width(status_text, 1, 2)) // 2
                 cv2.putText(frame, status_text, (text_x, 40),
                            cv2.FONT_HERSHEY_SIMPLEX, 1, status_color, 2)
             
@@ -28,6 +28,7 @@ class LEDController:
         self.current_state = LEDState.OFF
         self.blink_thread = None
         self.stop_blink = threading.Event()
+        self.auto_return_cancel = None  # Event for the pending auto-return, if any
         
         # Setup GPIO
         GPIO.setmode(GPIO.BCM)
@@ -59,6 +60,16 @@ class LEDController:
             state (LEDState): Target LED state
             duration (float, optional): Auto-return to idle after duration (seconds)
         """
+        # Re-asserting the current state is a no-op; avoids joining and
+        # restarting a healthy blink thread on every set_led_idle()
+        if state == self.current_state and duration is None:
+            blinking = self.blink_thread is not None and self.blink_thread.is_alive()
+            if state != LEDState.IDLE or blinking:
+                return
+        
+        # A new state supersedes any pending auto-return
+        self._cancel_auto_return()
+        
         # Stop any ongoing blinking
         self.stop_blink.set()
         if self.blink_thread and self.blink_thread.is_alive():
@@ -90,15 +101,27 @@ class LEDController:
         
         # Auto-return to idle after duration
         if duration and state != LEDState.IDLE:
+            cancel = threading.Event()
+            self.auto_return_cancel = cancel
+            
             def auto_return():
-                time.sleep(duration)
+                # Wakes early (and exits) as soon as the return is cancelled
+                if cancel.wait(duration):
+                    return
                 if self.current_state == state:  # Only return if state hasn't changed
                     self.set_state(LEDState.IDLE)
             
             threading.Thread(target=auto_return, daemon=True).start()
     
+    def _cancel_auto_return(self):
+        """Cancel the pending auto-return to idle, if one is scheduled"""
+        if self.auto_return_cancel:
+            self.auto_return_cancel.set()
+            self.auto_return_cancel = None
+    
     def cleanup(self):
         """Clean up GPIO resources"""
+        self._cancel_auto_return()
         self.stop_blink.set()
         if self.blink_thread and self.blink_thread.is_alive():
             self.blink_thread.join(timeout=1.0)
@@ -21,6 +21,12 @@ VERIFICATION_KEYWORDS = [
     "Expiration Date"
 ]
 
+# Patterns compiled once at import; the OCR helpers run them line by line
+OCR_NOISE_PATTERN = re.compile(r"[^a-zA-Z0-9\s,\.]")
+NAME_NOISE_PATTERN = re.compile(r"[^A-Z\s,.]")
+DATE_PATTERN = re.compile(r'\d{2}[-/]\d{2}[-/]\d{4}|\d{1,2}[-/]\d{1,2}[-/]\d{2,4}')
+LICENSE_NUMBER_PATTERN = re.compile(r'[A-Z]\d{2}-\d{2}-\d{6}|[A-Z]\d{8}|\d{10}')
+
 @dataclass
 class NameInfo:
     """Data structure for license verification results"""
@@ -113,7 +119,7 @@ def format_text_output(raw_text: str) -> str:
     cleaned = []
     for line in lines:
         line = line.strip()
-        sanitized = re.sub(r"[^a-zA-Z0-9\s,\.]", "", line)
+        sanitized = OCR_NOISE_PATTERN.sub("", line)
         if len(sanitized) >= 3 and any(c.isalpha() for c in sanitized):
             cleaned.append(sanitized)
     return "\n".join(cleaned)
@@ -169,7 +175,7 @@ def extract_name_from_lines(image_path: str, reference_name: str = "",
     lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
     
     for line in lines:
-        clean = re.sub(r"[^A-Z\s,.]", "", line.upper()).strip()
+        clean = NAME_NOISE_PATTERN.sub("", line.upper()).strip()
         
         if any(header in clean for header in VERIFICATION_KEYWORDS):
             continue
@@ -343,11 +349,13 @@ def cleanup_temp_file(temp_filename):
 
 # ============== MAIN LICENSE READING FUNCTIONS ==============
 
-def licenseRead(image_path: str, fingerprint_info: dict):
+def licenseRead(image_path: str, fingerprint_info: dict, basic_text: str = None):
     """Process license with fingerprint authentication"""
     reference_name = fingerprint_info['name']
 
-    basic_text = extract_text_from_image(image_path)
+    # Callers that already OCR'd the image pass its text to skip a second Tesseract run
+    if basic_text is None:
+        basic_text = extract_text_from_image(image_path)
     ocr_lines = [line.strip() for line in basic_text.splitlines() if line.strip()]
     name_from_ocr, sim_score = find_best_line_match(reference_name, ocr_lines)
 
@@ -375,11 +383,12 @@ def licenseRead(image_path: str, fingerprint_info: dict):
     
     return packaged
     
-def licenseReadGuest(image_path: str, guest_info: dict):
+def licenseReadGuest(image_path: str, guest_info: dict, basic_text: str = None):
     """Process license for guest verification (no fingerprint required) - IMPROVED VERSION"""
     guest_name = guest_info['name']
 
-    basic_text = extract_text_from_image(image_path)
+    if basic_text is None:
+        basic_text = extract_text_from_image(image_path)
     full_text = " ".join(basic_text.splitlines()).upper()
     
     # IMPROVED: More flexible document authenticity check
@@ -398,8 +407,8 @@ def licenseReadGuest(image_path: str, guest_info: dict):
     is_verified = len(matched_keywords) >= 1 or indicator_matches >= 2
     
     # Additional check: look for typical license patterns
-    has_date_pattern = bool(re.search(r'\d{2}[-/]\d{2}[-/]\d{4}|\d{1,2}[-/]\d{1,2}[-/]\d{2,4}', full_text))
-    has_license_number = bool(re.search(r'[A-Z]\d{2}-\d{2}-\d{6}|[A-Z]\d{8}|\d{10}', full_text))
+    has_date_pattern = bool(DATE_PATTERN.search(full_text))
+    has_license_number = bool(LICENSE_NUMBER_PATTERN.search(full_text))
     
     # Final verification decision
     if not is_verified:
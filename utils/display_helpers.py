@@ -1,7 +1,7 @@
-from utils.gui_helpers import show_message_gui
-
 def show_results_gui(title, message):
     """Show results in GUI message box"""
+    # Tk is only needed once a result is shown; keep it off the import path
+    from utils.gui_helpers import show_message_gui
     show_message_gui(title, message)
 
 def get_num(max_number):
@@ -33,6 +33,10 @@ def confirm_action(message, dangerous=False):
     prompt = f"⚠️ {message} (y/N): " if dangerous else f"❓ {message} (y/N): "
     return input(prompt).strip().lower() == 'y'
 
+def display_empty_state(message):
+    """Display a consistent notice when there is no data to show"""
+    print(f"📁 {message}")
+
 def display_separator(title=""):
     """Display formatted separator with optional title"""
     if title:
@@ -1,21 +1,83 @@
 import tkinter as tk
 from tkinter import messagebox
+from types import MappingProxyType
+
+# Shared, read-only button palette for all guest forms
+COLORS = MappingProxyType({
+    'success': "#4CAF50",
+    'danger': "#f44336",
+    'text': "white"
+})
+
+# Font tuples reused by every widget in the guest forms
+FONTS = MappingProxyType({
+    'header': ("Arial", 14, "bold"),
+    'body': ("Arial", 10),
+    'button': ("Arial", 10, "bold")
+})
+
+# Fixed (width, height) of the guest forms
+FORM_SIZE = (400, 300)
+
+# Offices a guest can visit; shared by the new-guest and return-visit forms
+OFFICE_OPTIONS = ("CSS Office", "Guidance", "IT Department", "Library", "Registrar", "Other")
+
+def _show_centered(root, size=FORM_SIZE):
+    """Size, center and map a withdrawn form with a single geometry call"""
+    width, height = size
+    x = (root.winfo_screenwidth() - width) // 2
+    y = (root.winfo_screenheight() - height) // 2
+    root.geometry(f'{width}x{height}+{x}+{y}')
+    root.deiconify()
+
+def _is_plate_text(proposed):
+    """Tk validatecommand: accept only characters that can appear on a plate"""
+    # isalnum() alone admits any Unicode letter/digit (e.g. 'Ñ', Arabic-Indic digits)
+    return all((char.isascii() and char.isalnum()) or char in " -" for char in proposed)
+
+def _field_label(parent, text):
+    """Pack a left-aligned field caption above an input"""
+    tk.Label(parent, text=text, font=FONTS['body']).pack(anchor='w')
+
+def _office_menu(parent, office_var):
+    """Pack the office drop-down bound to office_var"""
+    office_menu = tk.OptionMenu(parent, office_var, *OFFICE_OPTIONS)
+    office_menu.config(width=35)
+    office_menu.pack(pady=(0, 20), fill='x')
+    return office_menu
+
+def _button_bar(parent, confirm_text, on_confirm, on_cancel):
+    """Pack the confirm/cancel button row shared by the guest forms; returns the cancel button"""
+    button_frame = tk.Frame(parent)
+    button_frame.pack(fill='x')
+    
+    tk.Button(button_frame, text=confirm_text, command=on_confirm,
+              bg=COLORS['success'], fg=COLORS['text'], font=FONTS['button']).pack(side='left', padx=(0, 10))
+    
+    cancel_button = tk.Button(button_frame, text="❌ Cancel", command=on_cancel,
+                              bg=COLORS['danger'], fg=COLORS['text'], font=FONTS['button'])
+    cancel_button.pack(side='right')
+    return cancel_button
+
+def _bind_enter(root, on_submit, cancel_button):
+    """Submit on Enter anywhere in the form except while Cancel has focus"""
+    def on_return(event):
+        if event.widget is not cancel_button:
+            on_submit()
+    root.bind('<Return>', on_return)
 
 def show_message_gui(title, message):
+    """Show an informational message box without a visible root window"""
     root = tk.Tk()
     root.withdraw()  # Hide the root window
     messagebox.showinfo(title, message)
     root.destroy()
 
-def show_results_gui(title, message):
-    """Show results in GUI message box"""
-    show_message_gui(title, message)
-
 def get_guest_info_gui(detected_name):
     """Collect guest information through GUI interface"""
     root = tk.Tk()
+    root.withdraw()  # Build off-screen; shown once laid out and centered
     root.title("Guest Information")
-    root.geometry("400x300")
     root.resizable(False, False)
     
     guest_data = {}
@@ -24,34 +86,34 @@ def get_guest_info_gui(detected_name):
     
     # Header
     tk.Label(main_frame, text="👤 Guest Information", 
-             font=("Arial", 14, "bold")).pack(pady=(0, 20))
+             font=FONTS['header']).pack(pady=(0, 20))
     
     # Name field
-    tk.Label(main_frame, text="Full Name:", font=("Arial", 10)).pack(anchor='w')
-    name_entry = tk.Entry(main_frame, width=40, font=("Arial", 10))
+    _field_label(main_frame, "Full Name:")
+    name_entry = tk.Entry(main_frame, width=40, font=FONTS['body'])
     name_entry.insert(0, detected_name)
     name_entry.pack(pady=(0, 10), fill='x')
     
     # Plate number field
-    tk.Label(main_frame, text="Plate Number:", font=("Arial", 10)).pack(anchor='w')
-    plate_entry = tk.Entry(main_frame, width=40, font=("Arial", 10))
+    _field_label(main_frame, "Plate Number:")
+    plate_entry = tk.Entry(main_frame, width=40, font=FONTS['body'], validate='key',
+                           validatecommand=(root.register(_is_plate_text), '%P'))
     plate_entry.pack(pady=(0, 10), fill='x')
     
     # Office selection
-    tk.Label(main_frame, text="Office to Visit:", font=("Arial", 10)).pack(anchor='w')
-    office_var = tk.StringVar(value="CSS Office")
-    office_options = ["CSS Office", "Guidance", "IT Department", "Library", "Registrar", "Other"]
-    office_menu = tk.OptionMenu(main_frame, office_var, *office_options)
-    office_menu.config(width=35)
-    office_menu.pack(pady=(0, 20), fill='x')
+    _field_label(main_frame, "Office to Visit:")
+    office_var = tk.StringVar(value=OFFICE_OPTIONS[0])
+    _office_menu(main_frame, office_var)
     
     def submit_info():
         name = name_entry.get().strip()
         plate = plate_entry.get().strip().upper()
         office = office_var.get()
         
-        if not name or not plate:
-            messagebox.showerror("Error", "Please fill in all required fields.")
+        # Name every empty field in the one error dialog, not just a generic prompt
+        missing = [label for label, value in (("Full Name", name), ("Plate Number", plate)) if not value]
+        if missing:
+            messagebox.showerror("Error", "Please fill in: " + ", ".join(missing))
             return
         
         guest_data.update({
@@ -67,20 +129,12 @@ def get_guest_info_gui(detected_name):
         root.quit()
     
     # Buttons
-    button_frame = tk.Frame(main_frame)
-    button_frame.pack(fill='x')
-    
-    tk.Button(button_frame, text="✅ Submit", command=submit_info, 
-              bg="#4CAF50", fg="white", font=("Arial", 10, "bold")).pack(side='left', padx=(0, 10))
-    
-    tk.Button(button_frame, text="❌ Cancel", command=cancel_info,
-              bg="#f44336", fg="white", font=("Arial", 10, "bold")).pack(side='right')
+    cancel_button = _button_bar(main_frame, "✅ Submit", submit_info, cancel_info)
+    _bind_enter(root, submit_info, cancel_button)
+    root.bind('<Escape>', lambda event: cancel_info())
     
-    # Center window
-    root.update_idletasks()
-    x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
-    y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
-    root.geometry(f'+{x}+{y}')
+    name_entry.focus_set()  # So Enter/typing work without clicking into a field first
+    _show_centered(root)
     
     root.mainloop()
     root.destroy()
@@ -90,8 +144,8 @@ def get_guest_info_gui(detected_name):
 def updated_guest_office_gui(guest_name, current_office):
     """Allow a returning guest to update their office location"""
     root = tk.Tk()
+    root.withdraw()  # Build off-screen; shown once laid out and centered
     root.title("Select New Office")
-    root.geometry("400x300")
     root.resizable(False, False)
     
     guest_data = {}
@@ -100,16 +154,12 @@ def updated_guest_office_gui(guest_name, current_office):
     
     # Header
     tk.Label(main_frame, text=f"👤 {guest_name}'s Return Visit",
-             font=("Arial", 14, "bold")).pack(pady=(0, 20))
+             font=FONTS['header']).pack(pady=(0, 20))
     
     # Office selection
-    tk.Label(main_frame, text="Select New Office:", font=("Arial", 10)).pack(anchor='w')
+    _field_label(main_frame, "Select New Office:")
     office_var = tk.StringVar(value=current_office)  # Default to the current office
-    office_options = ["CSS Office", "Guidance", "IT Department", "Library", "Registrar", "Other"]
-    
-    office_menu = tk.OptionMenu(main_frame, office_var, *office_options)
-    office_menu.config(width=35)
-    office_menu.pack(pady=(0, 20), fill='x')
+    _office_menu(main_frame, office_var)
     
     # Update and Cancel buttons
     def submit_info():
@@ -126,20 +176,11 @@ def updated_guest_office_gui(guest_name, current_office):
         guest_data['updated'] = False
         root.quit()
     
-    button_frame = tk.Frame(main_frame)
-    button_frame.pack(fill='x')
-    
-    tk.Button(button_frame, text="✅ Update", command=submit_info,
-              bg="#4CAF50", fg="white", font=("Arial", 10, "bold")).pack(side='left', padx=(0, 10))
-    
-    tk.Button(button_frame, text="❌ Cancel", command=cancel_info,
-              bg="#f44336", fg="white", font=("Arial", 10, "bold")).pack(side='right')
+    cancel_button = _button_bar(main_frame, "✅ Update", submit_info, cancel_info)
+    _bind_enter(root, submit_info, cancel_button)
+    root.bind('<Escape>', lambda event: cancel_info())
     
-    # Center window on screen
-    root.update_idletasks()
-    x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
-    y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
-    root.geometry(f'+{x}+{y}')
+    _show_centered(root)
     
     root.mainloop()
     root.destroy()